@@ -1,9 +1,15 @@
 import mssql_python
 from mssql_python.exceptions import NotSupportedError, IntegrityError, DataError, ProgrammingError, OperationalError  # noqa: F401
 from azure import identity
-import struct
+from functools import lru_cache
+import queue
+import threading
+import tempfile
+import uuid
+from itertools import chain, islice
 import pandas as pd
-from typing import Any, Sequence
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Sequence
 import time
 import logging
 import re
@@ -19,10 +25,39 @@ def _validate_identifier(name: str) -> str:
         raise ValueError(f"Invalid SQL identifier: {name!r}")
     return name
 
+
+def _iter_rows(df: pd.DataFrame, chunk_rows: int = 10000) -> Iterator[tuple[Any, ...]]:
+    """
+    Yield DataFrame rows as tuples of strings, matching the varchar columns and SQL_WVARCHAR parameters they are bound to,
+    with missing values mapped to None. Rows are converted chunk_rows at a time so no full string copy of the frame is held.
+    """
+    # How a datetime or timedelta prints depends on the whole column (all-midnight columns drop the time), so those
+    # columns are converted up front to keep their text the same in every chunk
+    whole_column = df.select_dtypes(include=['datetime', 'datetimetz', 'timedelta']).columns
+    if len(whole_column):
+        df = df.astype({column: 'string' for column in whole_column})
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows].astype('string')
+        yield from chunk.astype(object).where(chunk.notna(), None).itertuples(index=False, name=None)
+
+
+@lru_cache(maxsize=128)
+def _insert_sql(table_name: str, columns: tuple[str, ...], row_count: int) -> str:
+    """Build a multi-row INSERT statement. Cached so every full-size batch reuses identical SQL text and the driver's prepared plan."""
+    columns_string = ', '.join([f'"{column}"' for column in columns])
+    row_placeholders = '(' + ', '.join(['?'] * len(columns)) + ')'
+    return f"INSERT INTO {table_name} ({columns_string}) values {', '.join([row_placeholders] * row_count)}"
+
 Base = declarative_base()
 
 logger = logging.getLogger(__name__)
 
+_MAX_PARAMETERS = 2099  # SQL Server accepts at most 2100 parameters per request
+_MAX_INSERT_ROWS = 1000  # SQL Server accepts at most 1000 rows per INSERT ... VALUES statement
+_ADAPTIVE_START_ROWS = 20  # Starting statement size for adaptive batch sizing
+_TOKEN_REFRESH_MARGIN = 300  # Seconds before expiry at which a cached access token is refreshed
+_POOL_VALIDATION_INTERVAL = 30  # Seconds a pooled connection is trusted before it is re-validated on checkout
+
 
 class AuthMethod(Enum):
     PASSWORDLESS = auto()
@@ -35,7 +70,11 @@ class AzureSqlConnection():
     duration of a program's execution and does not implicitly open or close the connection. Username and password are required
     for password-based authentication; if not supplied, passwordless authentication will be attempted.
     """
-    def __init__(self, server: str, database: str, schema: str, username: str | None = None, password: str | None = None, attempt_limit: int = 3, attempt_delay: int = 45, query_timeout: int = 0, **kwargs: dict[str,Any]) -> None:
+    _token_cache: tuple[dict[Any, Any], float] | None = None
+    _token_lock: threading.Lock = threading.Lock()
+    _bulkcopy_supported: bool = True  # Cleared the first time the installed driver turns out to lack cursor.bulkcopy()
+
+    def __init__(self, server: str, database: str, schema: str, username: str | None = None, password: str | None = None, attempt_limit: int = 3, attempt_delay: int = 45, query_timeout: int = 0, pool_min_size: int = 1, pool_max_size: int = 1, pool_timeout: float | None = None, **kwargs: dict[str,Any]) -> None:
         self.server: str = server or kwargs.get('server')
         self.database: str = database or kwargs.get('database')
         self.schema: str | None = schema or kwargs.get('schema')
@@ -44,11 +83,20 @@ class AzureSqlConnection():
         self.attempt_limit: int = attempt_limit or kwargs.get('attempt_limit')
         self.attempt_delay: int = attempt_delay or kwargs.get('attempt_delay')
         self.query_timeout: int = query_timeout
+        self.pool_min_size: int = pool_min_size
+        self.pool_max_size: int = max(pool_max_size, pool_min_size, 1)
+        self.pool_timeout: float | None = pool_timeout
         self.token: dict[Any, Any] | None = None
         self.attempt_count: int = 0
         self.mssql_connection: mssql_python.Connection | None = None
         self.sqlalchemy_connection: sqlalchemy.engine.base.Connection | None = None
         self.initial_attempt_time: float | None = None
+        self._pool: queue.Queue[mssql_python.Connection] = queue.Queue(maxsize=self.pool_max_size)
+        self._pool_size: int = 0
+        self._pool_lock: threading.Lock = threading.Lock()
+        self._validated_at: dict[int, float] = {}
+        self._checked_out: dict[int, bool] = {}  # id of each borrowed connection -> whether it goes back to the pool
+        self._local: threading.local = threading.local()
         self.connection_string: str = self.connection_string()
         self.auth_method: AuthMethod = self.auth_method()
 
@@ -57,7 +105,7 @@ class AzureSqlConnection():
         if self.mssql_connection is not None:
             return self.mssql_connection
         if self.auth_method == AuthMethod.PASSWORDLESS:
-            self.token = self.authenticate_passwordless() if self.token is None else self.token
+            self.token = self.authenticate_passwordless()
         while self.mssql_connection is None and self.attempt_count <= self.attempt_limit:
             try:
                 self.connection_attempt()
@@ -65,7 +113,11 @@ class AzureSqlConnection():
                 self.connection_failure(ex)
             else:
                 logger.info(f'Connection {self.mssql_connection} is succesful on attempt #{self.attempt_count}.')
-                logger.debug(f'Initial attempt time: {self.initial_attempt_time}, current time: {time.time()}, elapsed time: {time.time() - self.initial_attempt_time:.0f} seconds.')
+                now = time.monotonic()
+                logger.debug(f'Initial attempt time: {self.initial_attempt_time}, current time: {now}, elapsed time: {now - self.initial_attempt_time:.0f} seconds.')
+                while self._pool_size < self.pool_min_size:
+                    self._pool.put_nowait(self._open_connection())
+                    self._pool_size += 1
                 return self.mssql_connection
         raise ConnectionError('Unable to connect to Azure SQL Database.')
 
@@ -98,40 +150,145 @@ class AzureSqlConnection():
             return AuthMethod.USERNAME_PASSWORD
 
     def authenticate_passwordless(self) -> dict[Any, Any]:
-        logger.info('Attempting Azure passwordless authentication...')
-        credential = identity.DefaultAzureCredential(exclude_interactive_browser_credential=False)
-        try:
-            token_bytes = credential.get_token("https://database.windows.net/.default").token.encode("UTF-16-LE")
-        except Exception as ex:
-            raise ConnectionError(f'Azure authentication failed: {ex}.')
-        else:
-            logger.info('Azure passwordless authentication succeeded.')
-        token_struct = struct.pack(f'<I{len(token_bytes)}s', len(token_bytes), token_bytes)
-        sql_copt_ss_access_token = 1256  # This connection option is defined by microsoft in msodbcsql.h
-        auth_token_attr = {sql_copt_ss_access_token: token_struct}
+        with AzureSqlConnection._token_lock:
+            cached = AzureSqlConnection._token_cache
+            if cached is not None and cached[1] - time.time() > _TOKEN_REFRESH_MARGIN:
+                logger.debug('Reusing cached Azure access token.')
+                return cached[0]
+            logger.info('Attempting Azure passwordless authentication...')
+            credential = identity.DefaultAzureCredential(exclude_interactive_browser_credential=False)
+            try:
+                access_token = credential.get_token("https://database.windows.net/.default")
+            except Exception as ex:
+                raise ConnectionError(f'Azure authentication failed: {ex}.')
+            else:
+                logger.info('Azure passwordless authentication succeeded.')
+            token_bytes = access_token.token.encode("UTF-16-LE")
+            # Length-prefixed token struct: 4-byte little-endian length followed by the UTF-16-LE token
+            token_length = len(token_bytes)
+            token_buffer = bytearray(4 + token_length)
+            token_buffer[0:4] = token_length.to_bytes(4, 'little')
+            token_buffer[4:] = token_bytes
+            token_struct = bytes(token_buffer)
+            sql_copt_ss_access_token = 1256  # This connection option is defined by microsoft in msodbcsql.h
+            auth_token_attr = {sql_copt_ss_access_token: token_struct}
+            AzureSqlConnection._token_cache = (auth_token_attr, access_token.expires_on)
         return auth_token_attr
 
     def connection_attempt(self) -> None:
-        self.attempt_start_time = time.time()
+        self.attempt_start_time = time.monotonic()
         self.initial_attempt_time = self.attempt_start_time if self.initial_attempt_time is None else self.initial_attempt_time
         self.attempt_count += 1
         logger.info(f'Azure SQL Database connection attempt #{self.attempt_count}.')
-        logger.debug(f'self.attempt_start_time: {self.attempt_start_time}, self.attempt_delay: {self.attempt_delay}, time.time(): {time.time()}')
+        logger.debug(f'self.attempt_start_time: {self.attempt_start_time}, self.attempt_delay: {self.attempt_delay}')
+        self.mssql_connection = self._open_connection()
+        self._pool_size += 1
+        self._pool.put_nowait(self.mssql_connection)
+        return
+
+    def _open_connection(self) -> mssql_python.Connection:
         if self.auth_method == AuthMethod.PASSWORDLESS:
-            self.mssql_connection = mssql_python.connect(self.connection_string, attrs_before=self.token, timeout=self.query_timeout)
+            self.token = self.authenticate_passwordless()
+            connection = mssql_python.connect(self.connection_string, attrs_before=self.token, timeout=self.query_timeout)
         else:
-            self.mssql_connection = mssql_python.connect(self.connection_string, timeout=self.query_timeout)
-        return
+            connection = mssql_python.connect(self.connection_string, timeout=self.query_timeout)
+        self._validated_at[id(connection)] = time.monotonic()
+        return connection
+
+    @contextmanager
+    def _checkout(self) -> Iterator[mssql_python.Connection]:
+        """
+        Borrow a validated connection from the pool, opening a new one while the pool is below pool_max_size.
+        A thread that already holds a connection (e.g. inside an iter_sql loop) may still have a result set pending on it, so
+        it is given another one; if the pool is exhausted that is a temporary connection, closed on release, rather than a
+        wait on a pool the thread itself is holding.
+        """
+        if self.mssql_connection is None:
+            raise ConnectionError('No active connection to execute SQL.')
+        nested = getattr(self._local, 'depth', 0) > 0
+        pooled = True
+        try:
+            connection = self._pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                grow = self._pool_size < self.pool_max_size
+                if grow:
+                    self._pool_size += 1
+            if grow:
+                try:
+                    connection = self._open_connection()
+                except Exception:
+                    with self._pool_lock:
+                        self._pool_size -= 1
+                    raise
+            elif nested:
+                connection = self._open_connection()
+                pooled = False
+            else:
+                try:
+                    connection = self._pool.get(timeout=self.pool_timeout)
+                except queue.Empty:
+                    raise ConnectionError(f'No pooled connection became available within {self.pool_timeout} seconds.')
+        try:
+            connection = self._validate(connection)
+        except Exception:
+            if pooled:
+                with self._pool_lock:
+                    self._pool_size -= 1
+            raise
+        with self._pool_lock:
+            self._checked_out[id(connection)] = pooled
+        self._local.depth = getattr(self._local, 'depth', 0) + 1
+        try:
+            yield connection
+        finally:
+            self._local.depth -= 1
+            self._release(connection)
+
+    def _validate(self, connection: mssql_python.Connection) -> mssql_python.Connection:
+        """Run a cheap liveness query on connections idle longer than the validation interval, replacing dead ones."""
+        if time.monotonic() - self._validated_at.get(id(connection), 0.0) < _POOL_VALIDATION_INTERVAL:
+            return connection
+        try:
+            cursor = connection.cursor()
+            cursor.execute('SELECT 1')
+            cursor.fetchall()
+        except Exception as ex:
+            logger.warning(f'Discarding dead pooled connection: {ex}.')
+            self._discard(connection)
+            replacement = self._open_connection()
+            if connection is self.mssql_connection:
+                self.mssql_connection = replacement
+            return replacement
+        self._validated_at[id(connection)] = time.monotonic()
+        return connection
+
+    def _release(self, connection: mssql_python.Connection) -> None:
+        """Return a borrowed connection to the pool, or close it if it was temporary or the pool was closed meanwhile."""
+        with self._pool_lock:
+            pooled = self._checked_out.pop(id(connection), False)
+        if pooled:
+            self._pool.put_nowait(connection)
+        else:
+            self._discard(connection)
+
+    def _discard(self, connection: mssql_python.Connection) -> None:
+        """Close a connection and forget its validation time, so a later connection reusing its id starts unvalidated."""
+        self._validated_at.pop(id(connection), None)
+        try:
+            connection.close()
+        except Exception as ex:
+            logger.debug(f'Ignoring error closing connection: {ex}.')
 
     def connection_failure(self, exception: Exception) -> None:
-        exception_time = time.time()
-        attempt_timeout_time = exception_time + self.attempt_delay
+        now = time.monotonic()
+        attempt_timeout_time = now + self.attempt_delay
         logger.info(f'General error occured: {exception}. Retrying connection...')
-        logger.debug(f'{exception_time - self.attempt_start_time:.0f} seconds elapsed since last attempt.')
-        logger.debug(f'{exception_time - self.initial_attempt_time:.0f} seconds elapsed since initial attempt.')
-        logger.debug(f'self.attempt_start_time: {self.attempt_start_time}, self.attempt_delay: {self.attempt_delay}, time.time(): {time.time()}')
-        if attempt_timeout_time > time.time():
-            wait_time = attempt_timeout_time - time.time()
+        logger.debug(f'{now - self.attempt_start_time:.0f} seconds elapsed since last attempt.')
+        logger.debug(f'{now - self.initial_attempt_time:.0f} seconds elapsed since initial attempt.')
+        logger.debug(f'self.attempt_start_time: {self.attempt_start_time}, self.attempt_delay: {self.attempt_delay}, now: {now}')
+        if attempt_timeout_time > now:
+            wait_time = attempt_timeout_time - now
             logger.info(f'Waiting {wait_time:.0f} seconds before re-attempting connection...')
             time.sleep(wait_time)
         return
@@ -146,7 +303,7 @@ class AzureSqlConnection():
             logger.debug(str(row[0]))
         return
 
-    def write_table(self, df: pd.DataFrame, table_name: str, create: bool=True, fast: bool=True, max_rows: int=10000, columns: list[str] | None = None, max_column_length: int=255) -> None:
+    def write_table(self, df: pd.DataFrame, table_name: str, create: bool=True, fast: bool=True, max_rows: int=10000, columns: list[str] | None = None, max_column_length: int=255, adaptive: bool=False) -> None:
         _validate_identifier(table_name)
         if self.schema:
             _validate_identifier(self.schema)
@@ -155,22 +312,121 @@ class AzureSqlConnection():
         if self.mssql_connection is None:
             raise ConnectionError('No active connection to write data.')
         df_columns: list[str] = df.columns.tolist()
-        columns_string: str = ', '.join([f'"{column}"' for column in df_columns])
-        insert_placeholders: str = ', '.join(map(lambda _: '?', df_columns))
-        df = df.astype('string').fillna('')
-        data: Sequence[Sequence[Any]] = list(df.itertuples(index=False, name=None))
+        data: Iterator[tuple[Any, ...]] = _iter_rows(df)
         if create:
             self.drop_table(table_name)
             self.create_table(table_name, columns or df_columns)
+        if fast and self._bulk_copy(table_name, df_columns, data, max_rows):
+            return
         input_sizes = [(mssql_python.SQL_WVARCHAR, max_column_length, 0)] * len(df_columns)
-        for start_row in range(0, len(data), max_rows):
-            logger.info(f'Inserting rows {start_row + 1} to {min(start_row + max_rows, len(data))} ...')
-            end_row = start_row + max_rows
-            batch_data = data[start_row:end_row]
-            sql = f"INSERT INTO {table_name} ({columns_string}) values ({insert_placeholders})"
-            self.execute_sql(sql, data=batch_data, input_sizes=input_sizes)
+        rows_per_statement = max(1, min(max_rows, _MAX_INSERT_ROWS, _MAX_PARAMETERS // len(df_columns)))
+        statement_size = min(_ADAPTIVE_START_ROWS, rows_per_statement) if adaptive else rows_per_statement
+        tuning = adaptive and statement_size < rows_per_statement
+        best_row_time: float | None = None
+        best_size = statement_size
+        logger.info(f'Inserting up to {rows_per_statement} rows per statement (adaptive={adaptive}).')
+        with self._checkout() as connection:
+            # One cursor for the whole load so the driver keeps its prepared statement; commit once at the end
+            cursor = connection.cursor()
+            bound_row_count = 0
+            start_row = 0
+            try:
+                while batch_data := list(islice(data, max_rows)):
+                    logger.info(f'Inserting rows {start_row + 1} to {start_row + len(batch_data)} ...')
+                    offset = 0
+                    while offset < len(batch_data):
+                        statement_rows = batch_data[offset:offset + statement_size]
+                        if len(statement_rows) != bound_row_count:
+                            bound_row_count = len(statement_rows)
+                            sql = _insert_sql(table_name, tuple(df_columns), bound_row_count)
+                            cursor.setinputsizes(input_sizes * bound_row_count)
+                        statement_start = time.perf_counter()
+                        self._exec(cursor, sql, list(chain.from_iterable(statement_rows)))
+                        offset += len(statement_rows)
+                        if tuning and len(statement_rows) == statement_size:
+                            # Double the statement size while the per-row time keeps improving, then lock in the best size
+                            row_time = (time.perf_counter() - statement_start) / statement_size
+                            if best_row_time is None or row_time < best_row_time:
+                                best_row_time = row_time
+                                best_size = statement_size
+                                statement_size = min(statement_size * 2, rows_per_statement)
+                                tuning = len(statement_rows) < rows_per_statement
+                            else:
+                                statement_size = best_size
+                                tuning = False
+                            if not tuning:
+                                logger.info(f'Adaptive batch size locked in at {statement_size} rows per statement.')
+                    start_row += len(batch_data)
+            except Exception as ex:
+                cursor.rollback()
+                logger.error(f'Error inserting into {table_name}: {ex}.')
+                raise
+            cursor.commit()
         return
 
+    def write_table_bulk(self, df: pd.DataFrame, table_name: str, container_url: str, data_source: str, create: bool=True, columns: list[str] | None = None) -> None:
+        """Stage the DataFrame as a CSV blob and load it server-side with a single BULK INSERT.
+
+        container_url is the blob container URL (https://<account>.blob.core.windows.net/<container>) and data_source is the
+        name of an EXTERNAL DATA SOURCE in the database that points at the same container. The staged blob is deleted afterwards.
+        """
+        try:
+            from azure.storage.blob import ContainerClient
+        except ImportError as ex:
+            raise ImportError(
+                "azure-storage-blob is required for write_table_bulk. "
+                "Install it with: pip install 'utils[azure-blob]'"
+            ) from ex
+        _validate_identifier(table_name)
+        _validate_identifier(data_source)
+        if self.schema:
+            _validate_identifier(self.schema)
+        table_name = f'{self.schema}.{table_name}'
+        logger.debug(f'Starting blob bulk write to table {table_name} (create={create})...')
+        if self.mssql_connection is None:
+            raise ConnectionError('No active connection to write data.')
+        if create:
+            self.drop_table(table_name)
+            self.create_table(table_name, columns or df.columns.tolist())
+        container = ContainerClient.from_container_url(container_url, credential=identity.DefaultAzureCredential())
+        blob_name = f'{table_name}-{uuid.uuid4().hex}.csv'
+        blob = container.get_blob_client(blob_name)
+        with tempfile.TemporaryFile() as staging_file:
+            # BULK INSERT defaults to CRLF row terminators; pin both sides so the load doesn't depend on the client's os.linesep
+            df.to_csv(staging_file, index=False, encoding='utf-8', lineterminator='\r\n')
+            staging_file.seek(0)
+            logger.info(f'Uploading {len(df)} rows to blob {blob_name} ...')
+            blob.upload_blob(staging_file, overwrite=True)
+        try:
+            logger.info(f'Bulk inserting blob {blob_name} into {table_name} ...')
+            sql = f"BULK INSERT {table_name} FROM '{blob_name}' WITH (DATA_SOURCE = '{data_source}', FORMAT = 'CSV', FIRSTROW = 2, ROWTERMINATOR = '0x0d0a', CODEPAGE = '65001', TABLOCK);"
+            self.execute_sql(sql)
+        finally:
+            blob.delete_blob()
+        return
+
+    def _bulk_copy(self, table_name: str, columns: list[str], rows: Iterable[Sequence[Any]], batch_size: int) -> bool:
+        """Stream rows into a table using the driver's native TDS bulk copy. Returns False if the driver does not support it."""
+        if not AzureSqlConnection._bulkcopy_supported:
+            return False
+        with self._checkout() as connection:
+            cursor = connection.cursor()
+            bulkcopy = getattr(cursor, 'bulkcopy', None)
+            if bulkcopy is None:
+                # Drivers before 1.4 (including the locked 1.3.0) only have a private _bulkcopy; warn once per process
+                AzureSqlConnection._bulkcopy_supported = False
+                logger.warning('Installed mssql-python driver does not support cursor.bulkcopy() (requires >=1.4); write_table will use batched INSERT statements.')
+                return False
+            logger.info(f'Bulk copying rows into {table_name} ...')
+            try:
+                bulkcopy(table_name, rows=rows, columns=columns, batch_size=batch_size, table_lock=True)
+            except Exception as ex:
+                cursor.rollback()
+                logger.error(f'Error bulk copying into {table_name}: {ex}.')
+                raise
+            cursor.commit()
+        return True
+
     def read_table(self, table_name: str) -> pd.DataFrame:
         _validate_identifier(table_name)
         if self.schema:
@@ -179,45 +435,76 @@ class AzureSqlConnection():
         logger.debug(f'Starting direct read from table {table_name}...')
         if self.mssql_connection is None:
             raise ConnectionError('No active connection to write data.')
-        rows: list[dict[str, Any]] = []
         sql = f"SELECT * FROM {table_name}"
-        results, description = self.execute_sql(sql, return_results=True)
-        columns = [item[0] for item in description]
-        for row in results:
-            row_dict: dict[str, Any] = {}
-            for i, column_name in enumerate(columns):
-                row_dict[column_name] = row[i]
-            rows.append(row_dict)
-        df = pd.DataFrame(rows)
+        frames: list[pd.DataFrame] = []
+        for results, description in self.iter_sql(sql):
+            columns = [item[0] for item in description]
+            frames.append(pd.DataFrame.from_records(results, columns=columns))
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
         return df
 
-    def execute_sql(self, sql: str, data: list | None = None, return_results: bool = False, input_sizes: list | None = None) -> tuple[list[mssql_python.cursor.Row], list[tuple[str, int]]]:
-        if self.mssql_connection is None:
-            raise ConnectionError('No active connection to execute SQL.')
-        cursor = self.mssql_connection.cursor()
-        try:
-            if data is not None:
-                logger.debug(f'Executing SQL: {sql} with {len(data)} data rows.')
-                if input_sizes is not None:
-                    cursor.setinputsizes(input_sizes)
-                cursor.executemany(sql, data)
-            else:
-                logger.debug(f'Executing SQL: {sql}')
-                cursor.execute(sql)
-        except Exception as ex:
-            cursor.rollback()
-            logger.error(f'Error executing SQL: {ex}.')
-            raise
-        else:
-            logger.debug(f'{cursor.rowcount} rows affected.')
+    def execute_sql(self, sql: str, data: list | None = None, return_results: bool = False, input_sizes: list | None = None, params: Sequence[Any] | None = None) -> tuple[list[mssql_python.cursor.Row], list[tuple[str, int]]]:
+        with self._checkout() as connection:
+            cursor = connection.cursor()
+            try:
+                if data is not None:
+                    self._exec_many(cursor, sql, data, input_sizes)
+                else:
+                    self._exec(cursor, sql, params, input_sizes)
+            except Exception as ex:
+                cursor.rollback()
+                logger.error(f'Error executing SQL: {ex}.')
+                raise
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f'{cursor.rowcount} rows affected.')
             if return_results:
                 results = cursor.fetchall()
                 description = cursor.description
                 cursor.commit()
                 return results, description
+            cursor.commit()
+            return [], []
+
+    def _exec(self, cursor: mssql_python.cursor.Cursor, sql: str, params: Sequence[Any] | None = None, input_sizes: list | None = None) -> None:
+        """Execute a single statement on an open cursor. Leaves commit/rollback to the caller."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'Executing SQL: {sql}' if params is None else f'Executing SQL: {sql} with {len(params)} parameters.')
+        if input_sizes is not None:
+            cursor.setinputsizes(input_sizes)
+        if params is None:
+            cursor.execute(sql)
+        else:
+            cursor.execute(sql, params)
+
+    def _exec_many(self, cursor: mssql_python.cursor.Cursor, sql: str, data: Sequence[Sequence[Any]], input_sizes: list | None = None) -> None:
+        """Execute a statement once per parameter row on an open cursor. Leaves commit/rollback to the caller."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'Executing SQL: {sql} with {len(data)} data rows.')
+        if input_sizes is not None:
+            cursor.setinputsizes(input_sizes)
+        cursor.executemany(sql, data)
+
+    def iter_sql(self, sql: str, arraysize: int = 10000) -> Iterator[tuple[list[mssql_python.cursor.Row], list[tuple[str, int]]]]:
+        """Execute a query and yield (rows, description) pages of up to arraysize rows instead of buffering the full result set.
+        The first page is always yielded, even when empty, so callers can rely on the description."""
+        with self._checkout() as connection:
+            cursor = connection.cursor()
+            cursor.arraysize = arraysize
+            try:
+                self._exec(cursor, sql)
+                description = cursor.description
+                results = cursor.fetchmany(arraysize)
+                yield results, description
+                while results:
+                    results = cursor.fetchmany(arraysize)
+                    if results:
+                        yield results, description
+            except Exception as ex:
+                cursor.rollback()
+                logger.error(f'Error executing SQL: {ex}.')
+                raise
             else:
                 cursor.commit()
-                return [], []
 
     def drop_table(self, table_name: str) -> None:
         _validate_identifier(table_name)
@@ -251,7 +538,18 @@ class AzureSqlConnection():
         """
         results, description = self.execute_sql(sql, return_results=True)
         columns = [item[0] for item in description]
-        rows: list[dict] = []
-        for row in results:
-            rows.append(dict(zip(columns, row)))
-        return pd.DataFrame(rows)
+        return pd.DataFrame.from_records(results, columns=columns)
+
+    def close(self) -> None:
+        with self._pool_lock:
+            # Connections still checked out are closed by _release when their operation finishes
+            self._checked_out.clear()
+            self._pool_size = 0
+        while True:
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(connection)
+        self.mssql_connection = None
+        logger.debug('Azure SQL Database connections closed.')
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 
 
 def _validate_identifier(name: str) -> str:
@@ -16,25 +18,46 @@ def compare_dataframes(df1, df2):
     if not df1.columns.equals(df2.columns):
         raise ValueError("DataFrames must have the same columns")
 
-    # Merge the two DataFrames on all columns to find matching rows
-    merged = df1.merge(df2, on=list(df1.columns), how='outer', indicator=True)
+    # Hash each row once and compare the hashes instead of merging on every column;
+    # Series.isin probes a hash table, which is far cheaper than the sort np.isin does on uint64 keys
+    # Hashes depend on dtype (1 and 1.0 hash differently), so numeric column pairs are cast to a common dtype first;
+    # other mismatches are left alone so that e.g. 1 and '1' still differ
+    common_dtypes = {}
+    for column in df1.columns:
+        dtype1, dtype2 = df1[column].dtype, df2[column].dtype
+        if dtype1 != dtype2 and pd.api.types.is_numeric_dtype(dtype1) and pd.api.types.is_numeric_dtype(dtype2):
+            try:
+                common_dtypes[column] = np.result_type(dtype1, dtype2)
+            except TypeError:
+                # Nullable extension dtypes such as Int64 have no NumPy promotion
+                common_dtypes[column] = 'Float64'
+    h1 = pd.util.hash_pandas_object(df1.astype(common_dtypes), index=False)
+    h2 = pd.util.hash_pandas_object(df2.astype(common_dtypes), index=False)
+    in_df2 = h1.isin(h2).to_numpy()
+    in_df1 = h2.isin(h1).to_numpy()
 
     # Count the number of rows that are the same or different
-    same_rows = merged[merged['_merge'] == 'both'].shape[0]
-    different_rows = merged[merged['_merge'] != 'both'].shape[0]
+    same_rows = int(in_df2.sum())
+    different_rows = int((~in_df2).sum() + (~in_df1).sum())
 
-    exceptions = merged[merged['_merge'] != 'both']
+    exceptions = pd.concat([
+        df1[~in_df2].assign(_merge='left_only'),
+        df2[~in_df1].assign(_merge='right_only'),
+    ])
 
     print(exceptions.head(50).to_markdown())
 
     return same_rows, different_rows
 
 
-def compare_tables(dataframe1, dataframe2):
-    """Compare two tables and return a dictionary with the number of rows and columns that are the same and different."""
+def compare_tables(dataframe1, dataframe2, max_workers=1):
+    """Compare two tables and return a dictionary with the number of rows and columns that are the same and different.
+
+    Per-column work is spread across a process pool when max_workers is not 1 (None uses every core).
+    """
     # convert all fields to string
-    df1 = dataframe1.astype('string').replace(np.nan, '').map(lambda x: x.strip())
-    df2 = dataframe2.astype('string').replace(np.nan, '').map(lambda x: x.strip())
+    df1 = dataframe1.astype('string').fillna('').apply(lambda s: s.str.strip())
+    df2 = dataframe2.astype('string').fillna('').apply(lambda s: s.str.strip())
 
     # identify common columns
     df1_columns = df1.columns.tolist()
@@ -53,24 +76,26 @@ def compare_tables(dataframe1, dataframe2):
     print(f'Based on their index, the two tables have {len(common_records)} records in common\n')
 
     # for each common column, identify number of matching values
-    for column in common_columns:
-        s1 = df1[column]
-        s2 = df2[column]
-        df1_values = set(s1)
-        df2_values = set(s2)
-        shared_values = set(df1_values & df2_values)
-        df2_unique = list(df2_values - shared_values)
-        print(f'"{column}" (values): table 1 ({len(df1_values)}); table 2 ({len(df2_values)}); combined ({len(shared_values)})')
+    value_stats = _map_columns(
+        _column_value_stats, max_workers,
+        common_columns, [df1[column] for column in common_columns], [df2[column] for column in common_columns],
+    )
+    for column, df1_count, df2_count, shared_count, df2_unique in value_stats:
+        print(f'"{column}" (values): table 1 ({df1_count}); table 2 ({df2_count}); combined ({shared_count})')
         print(df2_unique)
 
-    df = (df1.isin(df2)
-          .transpose()
-          .loc[common_columns]
-          .stack()
-          .groupby(level=0)
-          .value_counts()
-          .unstack(fill_value=0)
-          )
+    # compare cell values in column shards
+    shard_count = min(len(common_columns), max_workers or os.cpu_count() or 1) or 1
+    shards = [list(shard) for shard in np.array_split(np.array(common_columns, dtype=object), shard_count)]
+    match_counts = np.concatenate(_map_columns(
+        _match_counts, max_workers,
+        [df1[shard] for shard in shards], [df2[shard] for shard in shards],
+    ))
+
+    df = pd.DataFrame(
+        {False: len(df1) - match_counts, True: match_counts},
+        index=[column for shard in shards for column in shard],
+    ).sort_index()
     df['match_rate'] = df[True] / (df[False] + df[True])
     columns_matching = len(df.loc[df['match_rate'] == 1])
     # return results
@@ -87,17 +112,39 @@ def compare_tables(dataframe1, dataframe2):
     return result_dict
 
 
+def _map_columns(function, max_workers, *iterables):
+    """Apply function across per-column arguments, in-process when max_workers is 1, otherwise in a process pool."""
+    if max_workers == 1:
+        return list(map(function, *iterables))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(function, *iterables))
+
+
+def _column_value_stats(column, s1, s2):
+    """Return (column, distinct count in s1, distinct count in s2, shared count, values only in s2)."""
+    df1_values = np.asarray(s1.unique(), dtype=object)
+    df2_values = np.asarray(s2.unique(), dtype=object)
+    shared_values = np.intersect1d(df1_values, df2_values, assume_unique=True)
+    df2_unique = np.setdiff1d(df2_values, shared_values, assume_unique=True).tolist()
+    return column, len(df1_values), len(df2_values), len(shared_values), df2_unique
+
+
+def _match_counts(left, right):
+    """Count, per column, the rows of left whose value equals right's value at the same index label."""
+    a = left.to_numpy(dtype=object)
+    b = right.reindex(left.index).to_numpy(dtype=object, na_value=None)
+    return (a == b).sum(axis=0)
+
+
 def find_value(connection, schema_columns, datatype, value):
     """Find a specific value in the database and return the tables and columns where it is found."""
     if datatype is not None:
-        df = schema_columns[schema_columns['datatype'] == datatype]
+        # Declared types are compared case-insensitively; SQLite's pragma_table_info can normalise integer to INTEGER
+        df = schema_columns[schema_columns['datatype'].str.upper() == str(datatype).upper()]
     else:
         df = schema_columns
-    for index, row in df.iterrows():
-        table = row['table']
-        column = row['column_name']
-        result = get_column_values(connection, table, column)
-        if value in result:
+    for table, column in df[['table', 'column_name']].itertuples(index=False, name=None):
+        if _column_has_value(connection, table, column, value):
             print(f'Found match in {table}.{column}!')
     return
 
@@ -112,29 +159,28 @@ def find_primary_key(connection, foreign_key_table, foreign_key_column, schema_c
     df = df[~((df['table'] == foreign_key_table) & (df['column_name'] == foreign_key_column))]
     if strict_type:
         datatype = foreign_key['datatype'].item()
-        df = df[(df['datatype'] == datatype)]
+        df = df[(df['datatype'].str.upper() == str(datatype).upper())]
     if keys_only:
         df = df[df['key'].notna()]
     print(f'Scanning {len(df)} potential columns')
-    values = list(set(get_column_values(connection, foreign_key_table, foreign_key_column)))
+    valuesets = {}
+    values = _column_valueset(connection, foreign_key_table, foreign_key_column, valuesets)
     if not strict_type:
-        values = [str(value) for value in values]
-    print(f'There are {len(list(set(values)))} unique values in {foreign_key_table}.{foreign_key_column}')
+        values = frozenset(str(value) for value in values)
+    print(f'There are {len(values)} unique values in {foreign_key_table}.{foreign_key_column}')
     results = []
-    for index, row in df.iterrows():
-        table = row['table']
-        column = row['column_name']
-        key_values = set(get_column_values(connection, table, column))
+    for table, column in df[['table', 'column_name']].itertuples(index=False, name=None):
+        key_values = _column_valueset(connection, table, column, valuesets)
         if not strict_type:
-            key_values = set([str(value) for value in list(key_values)])
-        key_values_matching = list(key_values.intersection(set(values)))
-        unused_values = list(set(key_values) - set(values))
-        percent_match = len(key_values_matching) / len(values)
+            key_values = frozenset(str(value) for value in key_values)
+        matched_values = len(key_values & values)
+        unused_values = len(key_values - values)
+        percent_match = matched_values / len(values)
         results.append({
             'table': table,
             'column': column,
-            'matched_values': len(key_values_matching),
-            'unused_values': len(unused_values),
+            'matched_values': matched_values,
+            'unused_values': unused_values,
             'percent_match': percent_match,
         })
     df = pd.DataFrame(results)
@@ -160,3 +206,24 @@ def get_column_values(connection, table, column, value=None):
     results = res.fetchall()
     values = [item[0] for item in results]
     return values
+
+
+def _column_has_value(connection, table, column, value):
+    """Return True if the column contains the value, letting the database do the search.
+
+    Uses SELECT ... WHERE EXISTS rather than LIMIT/TOP so the same SQL runs on SQLite and Azure SQL.
+    """
+    _validate_identifier(table)
+    _validate_identifier(column)
+    cur = connection.cursor()
+    sql = f'select 1 where exists (select 1 from {table} where "{column}" = ?);'
+    cur.execute(sql, (value,))
+    return cur.fetchone() is not None
+
+
+def _column_valueset(connection, table, column, memo):
+    """Return the distinct values of a column, memoized in memo for the duration of one scan."""
+    key = (table, column)
+    if key not in memo:
+        memo[key] = frozenset(get_column_values(connection, table, column))
+    return memo[key]
@@ -1,41 +1,140 @@
 import pygsheets
+import numpy as np
 import pandas as pd
 import logging
+import math
+import numbers
+import re
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
-def list_all_google_sheets(connection):
-    """List all Google Sheets spreadsheets accessible with the given connection."""
+_SPREADSHEET_MIME_TYPE = 'application/vnd.google-apps.spreadsheet'
+_DRIVE_BATCH_SIZE = 100  # Maximum sub-requests the Drive batch endpoint accepts per HTTP call
+_SHEETS_CELLS_PER_REQUEST = 50000  # Cells written per batchUpdate, matching pygsheets' own update chunking
+_FORMULA_PREFIX = r'[=+\-@]'  # Leading characters that make Sheets treat typed input as a formula
+
+
+def _list_spreadsheet_files(connection, fields: str) -> list[dict]:
+    """
+    List every accessible spreadsheet with the given fields in one paged files.list call, as pygsheets' spreadsheet_metadata
+    does: drive.list adds the shared-drive flags when a team drive is enabled, and an empty team-drive result is retried
+    across all drives.
+    """
+    drive = connection.drive
+    query = f"mimeType='{_SPREADSHEET_MIME_TYPE}'"
+    files = drive.list(q=query, fields=fields, pageSize=1000)
+    if drive.is_team_drive() and not files:
+        files = drive.list(q=query, fields=fields, pageSize=1000, corpora='allDrives')
+    return files
+
+
+def _spreadsheet_metadata(connection) -> dict[str, dict]:
+    """Fetch id, title and modified time of every accessible spreadsheet from Drive, keyed by id."""
+    files = _list_spreadsheet_files(connection, 'nextPageToken, files(id, name, modifiedTime)')
+    return {f['id']: f for f in files}
+
+
+def _list_sheet_ids(connection) -> list[str]:
+    """Fetch only the ids of every accessible spreadsheet from Drive."""
+    return [f['id'] for f in _list_spreadsheet_files(connection, 'nextPageToken, files(id)')]
+
+
+def _batch_delete(connection, file_ids: list[str]) -> None:
+    """Delete Drive files through batch requests of up to _DRIVE_BATCH_SIZE deletes each, raising the first failure once all batches have run."""
+    drive = connection.drive
+    errors = []
+
+    def _on_response(request_id, response, exception):
+        if exception is not None:
+            logger.error(f'Failed to delete spreadsheet ID: {request_id}: {exception}')
+            errors.append(exception)
+
+    for start in range(0, len(file_ids), _DRIVE_BATCH_SIZE):
+        batch = drive.service.new_batch_http_request(callback=_on_response)
+        for file_id in file_ids[start:start + _DRIVE_BATCH_SIZE]:
+            batch.add(drive.service.files().delete(fileId=file_id, supportsAllDrives=drive.is_team_drive()), request_id=file_id)
+        batch.execute()
+    if errors:
+        raise errors[0]
+
+
+@lru_cache(maxsize=4)
+def _get_gc(google_service_acct_file: str) -> pygsheets.client.Client:
+    """Authorize a pygsheets client for a service account file once and reuse it, along with its HTTP session."""
+    return pygsheets.authorize(service_account_file=google_service_acct_file)
+
+
+def _cell_data(value, field_leading_character: str | None = None) -> dict:
+    """
+    Build a Sheets CellData for a value: numbers and booleans keep their type, missing values clear the cell, anything else is text.
+    Numbers a double can't hold exactly (ints beyond 2**53, inf) are sent as text, with field_leading_character applied.
+    """
+    if value is None or value is pd.NA or value is pd.NaT or (isinstance(value, float) and math.isnan(value)):
+        return {}
+    if isinstance(value, bool):
+        return {'userEnteredValue': {'boolValue': value}}
+    if isinstance(value, numbers.Number):
+        if isinstance(value, numbers.Integral):
+            exact = int(float(value)) == value
+        else:
+            exact = math.isfinite(value)
+        if exact:
+            return {'userEnteredValue': {'numberValue': float(value)}}
+        text = str(value)
+        if field_leading_character and field_leading_character != '\'' and re.match(_FORMULA_PREFIX, text):
+            text = field_leading_character + text
+        return {'userEnteredValue': {'stringValue': text}}
+    return {'userEnteredValue': {'stringValue': str(value)}}
+
+
+def _user_entered_value(value):
+    """Convert a value to JSON for a USER_ENTERED values.update: missing values become empty cells, non-JSON types become text."""
+    if value is None or value is pd.NA or value is pd.NaT or (isinstance(value, float) and math.isnan(value)):
+        return ''
+    if isinstance(value, (bool, int, str)) or (isinstance(value, float) and math.isfinite(value)):
+        return value
+    return str(value)
+
+
+def list_all_google_sheets(connection, verbose: bool = False):
+    """List all Google Sheets spreadsheets accessible with the given connection. With verbose, log each one's title and update time."""
     logger.debug('Listing all Google Sheets spreadsheets.')
-    sheet_ids = connection.spreadsheet_ids()
+    if not verbose:
+        sheet_ids = _list_sheet_ids(connection)
+        logger.info(f'{len(sheet_ids)} Google Sheet spreadsheets found.')
+        return sheet_ids
+    metadata = _spreadsheet_metadata(connection)
+    sheet_ids = list(metadata)
     sheet_count = len(sheet_ids)
     logger.info(f'{sheet_count} Google Sheet spreadsheets found.')
-    for sheet in sheet_ids:
-        sh = connection.open_by_key(sheet)
-        logger.info(f'Title: {sh.title}, ID: {sh.id}, Updated: {sh.updated}')
+    for f in metadata.values():
+        logger.info(f"Title: {f['name']}, ID: {f['id']}, Updated: {f['modifiedTime']}")
     return sheet_ids
 
 
-def purge_all_google_sheets(connection, sheet_ids_to_keep):
-    """Delete all Google Sheets spreadsheets except those specified in sheet_ids_to_keep."""
+def purge_all_google_sheets(connection, sheet_ids_to_keep, verbose: bool = False):
+    """Delete all Google Sheets spreadsheets except those specified in sheet_ids_to_keep. With verbose, log each deleted one's title and update time."""
     logger.debug(f'Purging Google Sheets spreadsheets except {sheet_ids_to_keep}.')
-    sheet_ids = list_all_google_sheets(connection)
+    metadata = _spreadsheet_metadata(connection) if verbose else None
+    sheet_ids = list(metadata) if verbose else _list_sheet_ids(connection)
     sheet_ids_to_keep = [sheet_ids_to_keep] if isinstance(sheet_ids_to_keep, str) else sheet_ids_to_keep
     logger.info(f'{len(sheet_ids_to_keep)} spreadsheets identified to keep.')
-    sheet_ids_to_keep = [i for i in sheet_ids_to_keep if i in sheet_ids]
+    sheet_ids_to_keep = set(sheet_ids_to_keep).intersection(sheet_ids)
     sheet_ids_to_delete = [i for i in sheet_ids if i not in sheet_ids_to_keep]
     logger.info(f'{len(sheet_ids_to_keep)} spreadsheets will be kept, {len(sheet_ids_to_delete)} will be deleted.')
-    for sheet in sheet_ids_to_keep:
-        sh = connection.open_by_key(sheet)
-        logger.info(f'Deleting spreadsheet Title: {sh.title}, ID: {sh.id}, Updated: {sh.updated}')
-        sh.delete()
+    if verbose:
+        for sheet in sheet_ids_to_delete:
+            f = metadata[sheet]
+            logger.info(f"Deleting spreadsheet Title: {f['name']}, ID: {f['id']}, Updated: {f['modifiedTime']}")
+    _batch_delete(connection, sheet_ids_to_delete)
 
 
 def write_df_to_google_sheet(google_service_acct_file: str, sheet_id: str, worksheet_name: str, dataframe: pd.DataFrame, clear_existing: bool=True, resize_existing=True, field_leading_character: str = '\'') -> None:
     """Write a pandas DataFrame to a Google Sheet worksheet."""
     logger.debug(f'Writing DataFrame to Google Sheet ID: {sheet_id}, Worksheet: {worksheet_name}.')
     # Connect to Google service account
-    gc = pygsheets.authorize(service_account_file=google_service_acct_file)
+    gc = _get_gc(google_service_acct_file)
     sh = gc.open_by_key(sheet_id)
     wks = sh.worksheet_by_title(worksheet_name)
 
@@ -43,17 +142,51 @@ def write_df_to_google_sheet(google_service_acct_file: str, sheet_id: str, works
     if (nrows + 1) * ncols > 10 * 10**6:
         raise ValueError("Dataframe too large to fit in Google Sheet (max 10MM cells).")
 
-    if field_leading_character:
-        # Prepend leading character to all dataframe values to prevent Google Sheets from interpreting them as formulas or dates
-        dataframe = dataframe.astype(str).map(lambda x: field_leading_character + x)
+    # Fill one object array column by column rather than building whole intermediate string DataFrames
+    values = np.empty((nrows, ncols), dtype=object)
+    for i in range(ncols):
+        column = dataframe.iloc[:, i]
+        if field_leading_character and not pd.api.types.is_numeric_dtype(column):
+            # Cells are sent as stringValue, which Sheets stores verbatim and never parses as a formula or date.
+            # A leading apostrophe only asks for that when typed in, so it is implied; any other leading character is
+            # kept literally on cells that would start a formula. Numeric columns go out as typed numbers untouched.
+            column = column.astype(str)
+            if field_leading_character != '\'':
+                column = column.mask(column.str.match(_FORMULA_PREFIX), field_leading_character + column)
+        values[:, i] = column.to_numpy(dtype=object)
 
+    # Clear, resize and write in one batchUpdate; frames over _SHEETS_CELLS_PER_REQUEST cells spill into follow-up requests
+    requests = []
     if clear_existing:
-        # Clear existing worksheet data
-        wks.clear()
-
+        requests.append({'updateCells': {'range': {'sheetId': wks.id}, 'fields': 'userEnteredValue'}})
     if resize_existing:
-        # Resize worksheet to fit dataframe
-        wks.resize(rows=nrows + 1, cols=ncols)
+        requests.append({'updateSheetProperties': {
+            'properties': {'sheetId': wks.id, 'gridProperties': {'rowCount': nrows + 1, 'columnCount': ncols}},
+            'fields': 'gridProperties.rowCount,gridProperties.columnCount',
+        }})
+
+    header = [str(c) for c in dataframe.columns]
+    if not field_leading_character:
+        # Without a leading character values are parsed as if typed in (USER_ENTERED), so formulas, dates and numeric strings
+        # are interpreted; updateCells can't do that, so the values go through values.update after the clear/resize request
+        if requests:
+            gc.sheet.batch_update(sh.id, requests)
+        wks.update_values('A1', [header] + [[_user_entered_value(v) for v in row] for row in values.tolist()], parse=True)
+        return
 
-    # Write dataframe to worksheet
-    wks.set_dataframe(dataframe, (1, 1), copy_index=False)
+    # Each chunk is turned into a list of lists by NumPy in one call; the header takes the first row of the first chunk
+    rows_per_request = max(1, _SHEETS_CELLS_PER_REQUEST // max(ncols, 1))
+    batch = [header] + values[:rows_per_request - 1].tolist()
+    start = rows_per_request - 1
+    row_index = 0
+    while batch:
+        requests.append({'updateCells': {
+            'rows': [{'values': [_cell_data(v, field_leading_character) for v in row]} for row in batch],
+            'fields': 'userEnteredValue',
+            'start': {'sheetId': wks.id, 'rowIndex': row_index, 'columnIndex': 0},
+        }})
+        gc.sheet.batch_update(sh.id, requests)
+        requests = []
+        row_index += len(batch)
+        batch = values[start:start + rows_per_request].tolist()
+        start += rows_per_request
@@ -1,10 +1,19 @@
 import mysql.connector
-from mysql.connector import errorcode, MySQLConnection
+from mysql.connector import errorcode
+from mysql.connector.abstracts import MySQLConnectionAbstract
 import sshtunnel
+import sqlalchemy
+from sqlalchemy.pool import StaticPool
 import pandas as pd
+import csv
 import logging
+import os
 import re
-from typing import Any
+import tempfile
+import threading
+from contextlib import contextmanager
+from itertools import chain
+from typing import Any, Iterator, Mapping, Sequence
 
 
 def _validate_identifier(name: str) -> str:
@@ -14,12 +23,209 @@ def _validate_identifier(name: str) -> str:
     return name
 
 
+def _select_sql(table_name: str, columns: Sequence[str] | None = None, where: str | Mapping[str, Any] | None = None, limit: int | None = None, params: Sequence[Any] = ()) -> tuple[str, tuple[Any, ...]]:
+    """
+    Build a SELECT over table_name with optional column projection, WHERE clause and LIMIT, returning (sql, params).
+    A where string is inserted verbatim, so it must hold only %s placeholders, with the values passed in params. A where
+    mapping of column -> value is turned into equality tests joined by AND (None becomes IS NULL), with its values bound.
+    """
+    _validate_identifier(table_name)
+    if columns:
+        select_list = ', '.join(f'`{_validate_identifier(c)}`' for c in columns)
+    else:
+        select_list = '*'
+    sql = f'SELECT {select_list} FROM {table_name}'
+    params = tuple(params)
+    if isinstance(where, Mapping):
+        tests = [f'`{_validate_identifier(c)}` IS NULL' if v is None else f'`{_validate_identifier(c)}` = %s' for c, v in where.items()]
+        params = tuple(v for v in where.values() if v is not None) + params
+        where = ' AND '.join(tests)
+    if where:
+        sql += f' WHERE {where}'
+    if limit is not None:
+        sql += f' LIMIT {int(limit)}'
+    return sql + ';', params
+
+
+def _insert_values_sql(table_name: str, columns: list[str], row_count: int) -> str:
+    """Build one INSERT statement carrying row_count rows of %s placeholders."""
+    columns_string = ', '.join([f'"{col}"' for col in columns])
+    row_placeholders = '(' + ', '.join(['%s'] * len(columns)) + ')'
+    return f'INSERT INTO {table_name} ({columns_string}) VALUES {", ".join([row_placeholders] * row_count)}'
+
+
+def _dtype_to_sql(series: pd.Series) -> str:
+    """Map a pandas Series to a MySQL column type, sizing VARCHAR columns to the longest observed value."""
+    if pd.api.types.is_bool_dtype(series):
+        return 'TINYINT(1)'
+    if pd.api.types.is_integer_dtype(series):
+        return 'BIGINT'
+    if pd.api.types.is_float_dtype(series):
+        return 'DOUBLE'
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return 'DATETIME(6)'
+    lengths = series.dropna().astype(str).str.len()
+    max_length = int(lengths.max()) if len(lengths) else 0
+    if max_length <= 255:
+        # Round up to a power of two so small changes in the data do not change the DDL
+        return f'VARCHAR({min(255, 1 << max(0, max_length - 1).bit_length())})'
+    if max_length <= 16383:
+        return 'TEXT'
+    return 'LONGTEXT'
+
+
+def _load_data_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Prepare a DataFrame for LOAD DATA: booleans as 0/1, and backslashes, tabs, and line breaks escaped in text columns."""
+    df = df.copy(deep=False)
+    for col in df.columns:
+        if pd.api.types.is_bool_dtype(df[col]):
+            df[col] = df[col].astype('Int8')
+        elif df[col].dtype == object or pd.api.types.is_string_dtype(df[col]):
+            values = df[col].astype(object)
+            mask = values.notna()
+            values[mask] = (values[mask].astype(str)
+                            .str.replace('\\', '\\\\', regex=False)
+                            .str.replace('\t', '\\t', regex=False)
+                            .str.replace('\n', '\\n', regex=False)
+                            .str.replace('\r', '\\r', regex=False))
+            df[col] = values
+    return df
+
+
+def _open_mysql(params: dict[str, Any]) -> MySQLConnectionAbstract:
+    """Open a connection through the C extension, which decodes result rows in C, when the installed connector has it."""
+    if mysql.connector.HAVE_CEXT:
+        return mysql.connector.connect(**params, use_pure=False)
+    return mysql.connector.connect(**params)
+
+
+def _fetch_frame(cursor, fetch_rows: int) -> pd.DataFrame:
+    """Drain an executed cursor fetch_rows at a time, building one DataFrame per page and concatenating them."""
+    columns = [desc[0] for desc in cursor.description]
+    frames = []
+    while rows := cursor.fetchmany(fetch_rows):
+        frames.append(pd.DataFrame(rows, columns=columns))
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)
+
+
 logger = logging.getLogger(__name__)
 
+_INSERT_CHUNK_ROWS = 1000  # Rows per multi-row INSERT; keeps statements well under the default max_allowed_packet
+_LOCAL_INFILE_DISABLED_ERRNOS = {1148, 2068, 3948}  # LOAD DATA LOCAL rejected by the server or client configuration
+_FETCH_ROWS = 10000  # Rows pulled per fetchmany when streaming a table into a DataFrame
+
 sshtunnel.SSH_TIMEOUT = 15.0
 sshtunnel.TUNNEL_TIMEOUT = 15.0
 
 
+class SSHTunnelPool:
+    """
+    Shares SSH tunnels between MySQL connections to the same host, keyed by (ssh_host, ssh_port, ssh_user, host, mysql_port).
+    A tunnel is started on first use, reference-counted while in use, and stopped once it has been idle for idle_timeout seconds.
+    """
+
+    def __init__(self, idle_timeout: float = 60.0) -> None:
+        self.idle_timeout = idle_timeout
+        self._tunnels: dict[tuple, sshtunnel.SSHTunnelForwarder] = {}
+        # Counted per tunnel rather than per key, so a dead tunnel that was replaced can still be released
+        self._refcounts: dict[sshtunnel.SSHTunnelForwarder, int] = {}
+        self._idle_timers: dict[tuple, threading.Timer] = {}
+        self._key_locks: dict[tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, ssh_host: str, ssh_user: str | None, ssh_pw: str | None, host: str, ssh_port: int = 22, mysql_port: int = 3306) -> sshtunnel.SSHTunnelForwarder:
+        """Return a started tunnel for the key, starting one if needed. Pair every call with release()."""
+        key = (ssh_host, ssh_port, ssh_user, host, mysql_port)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # The per-key lock stops two callers starting the same tunnel; the SSH handshake runs outside the pool lock so
+        # other keys, releases and idle timers aren't held up behind it
+        with key_lock:
+            with self._lock:
+                timer = self._idle_timers.pop(key, None)
+                if timer is not None:
+                    timer.cancel()
+                tunnel = self._tunnels.get(key)
+                if tunnel is not None and tunnel.is_active:
+                    self._refcounts[tunnel] += 1
+                    return tunnel
+            tunnel = sshtunnel.SSHTunnelForwarder(
+                (ssh_host, ssh_port),
+                ssh_username=ssh_user,
+                ssh_password=ssh_pw,
+                remote_bind_address=(host, mysql_port),
+            )
+            tunnel.start()
+            logger.info('SSH tunnel established.')
+            with self._lock:
+                stale = self._tunnels.get(key)
+                if stale is not None and self._refcounts.get(stale, 0) <= 0:
+                    self._refcounts.pop(stale, None)
+                else:
+                    stale = None
+                self._tunnels[key] = tunnel
+                self._refcounts[tunnel] = 1
+        if stale is not None:
+            stale.stop()
+        return tunnel
+
+    def release(self, tunnel: sshtunnel.SSHTunnelForwarder) -> None:
+        """Drop one reference to a tunnel; the last release schedules it to stop after idle_timeout seconds."""
+        with self._lock:
+            if tunnel not in self._refcounts:
+                return
+            self._refcounts[tunnel] -= 1
+            if self._refcounts[tunnel] > 0:
+                return
+            key = next((k for k, t in self._tunnels.items() if t is tunnel), None)
+            if key is None:
+                # A tunnel that has since been replaced under its key; nothing else can hand it out, so stop it now
+                del self._refcounts[tunnel]
+            else:
+                timer = threading.Timer(self.idle_timeout, self._stop_idle, args=(key,))
+                timer.daemon = True
+                self._idle_timers[key] = timer
+                timer.start()
+                return
+        tunnel.stop()
+
+    @contextmanager
+    def acquire(self, ssh_host: str, ssh_user: str | None, ssh_pw: str | None, host: str, ssh_port: int = 22, mysql_port: int = 3306) -> Iterator[sshtunnel.SSHTunnelForwarder]:
+        tunnel = self.get(ssh_host, ssh_user, ssh_pw, host, ssh_port, mysql_port)
+        try:
+            yield tunnel
+        finally:
+            self.release(tunnel)
+
+    def close(self) -> None:
+        """Stop every pooled tunnel immediately."""
+        with self._lock:
+            for timer in self._idle_timers.values():
+                timer.cancel()
+            tunnels = set(self._tunnels.values()) | set(self._refcounts)
+            self._idle_timers.clear()
+            self._tunnels.clear()
+            self._refcounts.clear()
+        for tunnel in tunnels:
+            tunnel.stop()
+
+    def _stop_idle(self, key: tuple) -> None:
+        with self._lock:
+            tunnel = self._tunnels.get(key)
+            if tunnel is None or self._refcounts.get(tunnel, 0) > 0:
+                return
+            self._idle_timers.pop(key, None)
+            self._refcounts.pop(tunnel, None)
+            del self._tunnels[key]
+        tunnel.stop()
+        logger.debug('Idle SSH tunnel closed.')
+
+
+_default_tunnel_pool = SSHTunnelPool()
+
+
 class MySqlConnection:
     """
     A class for connecting to a MySQL database (optionally via SSH tunnel) and executing SQL queries.
@@ -27,6 +233,9 @@ class MySqlConnection:
 
     If ssh_host is provided, the connection will be tunnelled through SSH. Otherwise a direct
     TCP connection to host:mysql_port is made.
+
+    If pool_size is set, connect() opens a pool of up to that many connections instead of a single connection, and each
+    operation borrows a connection for its duration, so the instance can be shared across threads.
     """
 
     def __init__(
@@ -40,6 +249,9 @@ class MySqlConnection:
         ssh_pw: str | None = None,
         ssh_port: int = 22,
         mysql_port: int = 3306,
+        allow_local_infile: bool = False,
+        tunnel_pool: SSHTunnelPool | None = None,
+        pool_size: int | None = None,
     ) -> None:
         self.host = host
         self.user = user
@@ -50,22 +262,30 @@ class MySqlConnection:
         self.ssh_pw = ssh_pw
         self.ssh_port = ssh_port
         self.mysql_port = mysql_port
+        self.allow_local_infile = allow_local_infile
+        self.tunnel_pool = tunnel_pool or _default_tunnel_pool
         self._tunnel: sshtunnel.SSHTunnelForwarder | None = None
-        self._connection: MySQLConnection | None = None
-
-    def connect(self) -> MySQLConnection:
+        self.pool_size = pool_size
+        self._connection: MySQLConnectionAbstract | None = None
+        # Pool state: the connection parameters once connected, plus the idle and checked-out connections (keyed by id)
+        self._pool_params: dict[str, Any] | None = None
+        self._pool_idle: list[MySQLConnectionAbstract] = []
+        self._pool_checked_out: dict[int, MySQLConnectionAbstract] = {}
+        self._pool_lock = threading.Lock()
+        self._pool_slots = threading.BoundedSemaphore(pool_size) if pool_size else None
+        self._local = threading.local()
+
+    def connect(self) -> MySQLConnectionAbstract | None:
+        """Open the connection, or the pool when pool_size is set; pooled connections are only handed out per operation, so None is returned."""
         logger.debug('Starting MySQL connection process...')
+        if self._pool_params is not None:
+            return None
         if self._connection is not None and self._connection.is_connected():
             return self._connection
         if self.ssh_host:
-            self._tunnel = sshtunnel.SSHTunnelForwarder(
-                (self.ssh_host, self.ssh_port),
-                ssh_username=self.ssh_user,
-                ssh_password=self.ssh_pw,
-                remote_bind_address=(self.host, self.mysql_port),
-            )
-            self._tunnel.start()
-            logger.info('SSH tunnel established.')
+            if self._tunnel is not None:
+                self.tunnel_pool.release(self._tunnel)
+            self._tunnel = self.tunnel_pool.get(self.ssh_host, self.ssh_user, self.ssh_pw, self.host, self.ssh_port, self.mysql_port)
             mysql_host = '127.0.0.1'
             mysql_port = self._tunnel.local_bind_port
         else:
@@ -79,8 +299,18 @@ class MySqlConnection:
         }
         if self.database:
             params['database'] = self.database
+        if self.allow_local_infile:
+            params['allow_local_infile'] = True
         try:
-            self._connection = MySQLConnection(**params)
+            if self.pool_size:
+                # The first connection checks the credentials; the rest are opened as concurrent callers need them
+                connection = _open_mysql(params)
+                with self._pool_lock:
+                    self._pool_params = params
+                    self._pool_idle.append(connection)
+                logger.info(f'Connected to MySQL database with a pool of up to {self.pool_size} connections.')
+                return None
+            self._connection = _open_mysql(params)
             logger.info('Connected to MySQL database.')
         except mysql.connector.Error as err:
             if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
@@ -92,55 +322,201 @@ class MySqlConnection:
             raise
         return self._connection
 
+    @contextmanager
+    def _checkout(self) -> Iterator[MySQLConnectionAbstract]:
+        """
+        Yield the connection to run an operation on. When pooled, a connection is borrowed for the outermost operation
+        on this thread and returned when it finishes; nested calls reuse it so they share one session.
+        """
+        if self._pool_params is None:
+            yield self._connection
+            return
+        held = getattr(self._local, 'connection', None)
+        if held is not None:
+            yield held
+            return
+        # Callers beyond pool_size queue on the semaphore for a free connection
+        with self._pool_slots:
+            connection = self._pool_get()
+            self._local.connection = connection
+            try:
+                yield connection
+            finally:
+                self._local.connection = None
+                self._pool_put(connection)
+
+    def _pool_get(self) -> MySQLConnectionAbstract:
+        """Take an idle pooled connection, or open one, and record it as checked out."""
+        with self._pool_lock:
+            params = self._pool_params
+            connection = self._pool_idle.pop() if self._pool_idle else None
+        if params is None:
+            raise ConnectionError('No active connection.')
+        if connection is not None and not connection.is_connected():
+            logger.debug('Replacing a disconnected pooled MySQL connection.')
+            connection.close()
+            connection = None
+        if connection is None:
+            connection = _open_mysql(params)
+        with self._pool_lock:
+            self._pool_checked_out[id(connection)] = connection
+        return connection
+
+    def _pool_put(self, connection: MySQLConnectionAbstract) -> None:
+        """Return a connection to the idle list with its session reset, or close it if the pool was closed meanwhile."""
+        with self._pool_lock:
+            pooled = self._pool_checked_out.pop(id(connection), None) is not None
+        if pooled:
+            try:
+                # Clear session settings and variables before the next borrower, as MySQLConnectionPool does
+                connection.reset_session()
+            except mysql.connector.Error as ex:
+                logger.warning(f'Discarding pooled MySQL connection whose session could not be reset: {ex}.')
+                pooled = False
+        if pooled:
+            with self._pool_lock:
+                if self._pool_params is not None:
+                    self._pool_idle.append(connection)
+                    return
+        connection.close()
+
     def basic_connectivity_test(self) -> None:
         logger.debug('Starting basic connectivity test...')
-        if self._connection is None:
+        if self._connection is None and self._pool_params is None:
             raise ConnectionError('No active connection to test.')
         sql = 'SELECT NOW() as timestamp;'
         results, _ = self.execute_sql(sql, return_results=True)
         for row in results:
             logger.debug(str(row[0]))
 
-    def read_table(self, table_name: str) -> pd.DataFrame:
-        _validate_identifier(table_name)
+    def read_table(self, table_name: str, columns: Sequence[str] | None = None, where: str | Mapping[str, Any] | None = None, limit: int | None = None, params: Sequence[Any] = ()) -> pd.DataFrame:
+        """
+        Read a table into a DataFrame, projecting, filtering and limiting on the server. where is either a SQL fragment
+        using %s placeholders for values supplied in params (never format values into it) or a column -> value mapping.
+        """
+        sql, params = _select_sql(table_name, columns, where, limit, params)
         logger.debug(f'Reading table {table_name}...')
-        if self._connection is None:
+        if self._connection is None and self._pool_params is None:
             raise ConnectionError('No active connection to read data.')
-        sql = f'SELECT * FROM {table_name};'
-        results, description = self.execute_sql(sql, return_results=True)
-        columns = [item[0] for item in description]
-        return pd.DataFrame(results, columns=columns)
+        logger.debug(f'Executing SQL: {sql}')
+        with self._checkout() as connection:
+            cursor = connection.cursor(buffered=False)
+            try:
+                cursor.execute(sql, params or None)
+                return _fetch_frame(cursor, _FETCH_ROWS)
+            except mysql.connector.Error as ex:
+                logger.error(f'Error executing SQL: {ex}.')
+                raise
+            finally:
+                cursor.close()
 
     def write_table(self, df: pd.DataFrame, table_name: str, create: bool = True) -> None:
         _validate_identifier(table_name)
         logger.debug(f'Writing table {table_name} (create={create})...')
-        if self._connection is None:
+        if self._connection is None and self._pool_params is None:
             raise ConnectionError('No active connection to write data.')
-        if create:
-            self.drop_table(table_name)
-            self.execute_sql("SET sql_mode='ANSI_QUOTES';")
-            self.create_table(table_name, df.columns.tolist())
-        placeholders = ', '.join(['%s'] * len(df.columns))
-        columns_string = ', '.join([f'"{col}"' for col in df.columns])
-        sql = f'INSERT INTO {table_name} ({columns_string}) VALUES ({placeholders})'
         def _to_mysql_value(v):
+            if pd.api.types.is_scalar(v) and pd.isna(v):
+                return None
             if isinstance(v, pd.Timestamp):
                 return v.to_pydatetime()
             return v
 
-        data = [tuple(_to_mysql_value(v) for v in row) for _, row in df.iterrows()]
-        chunk_size = 500
-        for i in range(0, len(data), chunk_size):
-            self.execute_sql(sql, data=data[i:i + chunk_size])
-
-    def execute_sql(self, sql: str, data: list | None = None, return_results: bool = False) -> tuple[list, list]:
-        if self._connection is None:
+        data = [tuple(_to_mysql_value(v) for v in row) for row in df.itertuples(index=False, name=None)]
+        with self._checkout():
+            if create:
+                self.drop_table(table_name)
+                self.execute_sql("SET sql_mode='ANSI_QUOTES';")
+                self.create_table(table_name, df.columns.tolist(), [_dtype_to_sql(df.iloc[:, i]) for i in range(df.shape[1])])
+            with self._bulk_load_cursor() as cursor:
+                for i in range(0, len(data), _INSERT_CHUNK_ROWS):
+                    chunk = data[i:i + _INSERT_CHUNK_ROWS]
+                    sql = _insert_values_sql(table_name, df.columns.tolist(), len(chunk))
+                    cursor.execute(sql, list(chain.from_iterable(chunk)))
+        logger.info(f'Inserted {len(data)} rows into {table_name}.')
+
+    @contextmanager
+    def _bulk_load_cursor(self) -> Iterator[Any]:
+        """
+        Yield a cursor for a bulk load run as one transaction, with autocommit, unique checks and foreign key checks
+        switched off for the session. Commits on success, rolls back on error, and restores the previous settings either way.
+        """
+        with self._checkout() as connection:
+            cursor = connection.cursor()
+            cursor.execute('SELECT @@autocommit, @@unique_checks, @@foreign_key_checks;')
+            saved = cursor.fetchone()
+            cursor.execute('SET autocommit=0, unique_checks=0, foreign_key_checks=0;')
+            failed = False
+            try:
+                yield cursor
+                connection.commit()
+            except BaseException as ex:
+                # Roll back on anything, including KeyboardInterrupt: restoring autocommit=1 below would otherwise commit the partial load
+                failed = True
+                logger.error(f'Error during bulk load, rolling back: {ex!r}.')
+                connection.rollback()
+                raise
+            finally:
+                try:
+                    cursor.execute('SET autocommit=%s, unique_checks=%s, foreign_key_checks=%s;', saved)
+                    cursor.close()
+                except mysql.connector.Error as ex:
+                    # On a broken connection the restore fails too; don't let that replace the load's own error
+                    logger.error(f'Could not restore session settings after bulk load: {ex}.')
+                    if not failed:
+                        raise
+
+    def write_table_bulk(self, df: pd.DataFrame, table_name: str, create: bool = True) -> None:
+        """Write a DataFrame with LOAD DATA LOCAL INFILE, falling back to write_table if local infile is disabled.
+
+        Requires allow_local_infile=True on the connection and local_infile=ON on the server.
+        """
+        _validate_identifier(table_name)
+        logger.debug(f'Bulk loading table {table_name} (create={create})...')
+        if self._connection is None and self._pool_params is None:
+            raise ConnectionError('No active connection to write data.')
+        with self._checkout():
+            self.execute_sql("SET sql_mode='ANSI_QUOTES';")
+            if create:
+                self.drop_table(table_name)
+                self.create_table(table_name, df.columns.tolist(), [_dtype_to_sql(df.iloc[:, i]) for i in range(df.shape[1])])
+            columns_string = ', '.join([f'"{col}"' for col in df.columns])
+            staging_file = tempfile.NamedTemporaryFile(mode='w', suffix='.tsv', encoding='utf-8', newline='', delete=False)
+            try:
+                with staging_file:
+                    _load_data_frame(df).to_csv(staging_file, sep='\t', header=False, index=False, na_rep='\\N', lineterminator='\n', quoting=csv.QUOTE_NONE)
+                path = staging_file.name.replace('\\', '/')
+                sql = (
+                    f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE {table_name} CHARACTER SET utf8mb4 "
+                    f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' ({columns_string});"
+                )
+                try:
+                    self.execute_sql(sql)
+                except mysql.connector.Error as err:
+                    if err.errno not in _LOCAL_INFILE_DISABLED_ERRNOS:
+                        raise
+                    logger.warning(f'LOAD DATA LOCAL INFILE is disabled ({err}); falling back to multi-row INSERT.')
+                    self.write_table(df, table_name, create=False)
+                else:
+                    logger.info(f'Loaded {len(df)} rows into {table_name}.')
+            finally:
+                os.remove(staging_file.name)
+
+    def execute_sql(self, sql: str, data: list | None = None, return_results: bool = False, params: Sequence[Any] | None = None) -> tuple[list, list]:
+        if self._connection is None and self._pool_params is None:
             raise ConnectionError('No active connection to execute SQL.')
-        cursor = self._connection.cursor()
+        with self._checkout() as connection:
+            return self._execute(connection, sql, data, return_results, params)
+
+    def _execute(self, connection: MySQLConnectionAbstract, sql: str, data: list | None, return_results: bool, params: Sequence[Any] | None) -> tuple[list, list]:
+        cursor = connection.cursor()
         try:
             if data is not None:
                 logger.debug(f'Executing SQL: {sql} with {len(data)} data rows.')
                 cursor.executemany(sql, data)
+            elif params is not None:
+                logger.debug(f'Executing SQL: {sql} with {len(params)} parameters.')
+                cursor.execute(sql, params)
             else:
                 logger.debug(f'Executing SQL: {sql}')
                 cursor.execute(sql)
@@ -148,7 +524,7 @@ class MySqlConnection:
             logger.error(f'Error executing SQL: {ex}.')
             raise
         else:
-            self._connection.commit()
+            connection.commit()
             if return_results:
                 results = cursor.fetchall()
                 description = list(cursor.description) if cursor.description else []
@@ -162,12 +538,16 @@ class MySqlConnection:
         logger.debug(f'Dropping table {table_name}...')
         self.execute_sql(f'DROP TABLE IF EXISTS {table_name};')
 
-    def create_table(self, table_name: str, columns: list[str]) -> None:
+    def create_table(self, table_name: str, columns: list[str], column_types: list[str] | None = None) -> None:
         _validate_identifier(table_name)
         for col in columns:
             _validate_identifier(col)
+        column_types = column_types or ['VARCHAR(255)'] * len(columns)
+        for column_type in column_types:
+            if not re.match(r'^[\w(), ]+$', column_type):
+                raise ValueError(f"Invalid SQL column type: {column_type!r}")
         logger.debug(f'Creating table {table_name}...')
-        cols_sql = ', '.join([f'"{col}" VARCHAR(255)' for col in columns])
+        cols_sql = ', '.join([f'"{col}" {column_type}' for col, column_type in zip(columns, column_types)])
         sql = f'CREATE TABLE {table_name} ({cols_sql});'
         self.execute_sql(sql)
 
@@ -185,27 +565,46 @@ class MySqlConnection:
         return pd.DataFrame(results, columns=columns)
 
     def close(self) -> None:
+        if self._pool_params is not None:
+            with self._pool_lock:
+                idle, self._pool_idle = self._pool_idle, []
+                # Connections still checked out are closed by _pool_put when their operation finishes
+                self._pool_checked_out.clear()
+                self._pool_params = None
+            for connection in idle:
+                connection.close()
+            logger.debug('MySQL connection pool closed.')
         if self._connection is not None:
             self._connection.close()
             self._connection = None
             logger.debug('MySQL connection closed.')
         if self._tunnel is not None:
-            self._tunnel.stop()
+            self.tunnel_pool.release(self._tunnel)
             self._tunnel = None
-            logger.debug('SSH tunnel closed.')
+            logger.debug('SSH tunnel released.')
 
 
 # ---------------------------------------------------------------------------
 # Module-level backward-compatibility shims — deprecated, use MySqlConnection
 # ---------------------------------------------------------------------------
 
+@contextmanager
+def _tunnel_started(ssh_conn: sshtunnel.SSHTunnelForwarder) -> Iterator[sshtunnel.SSHTunnelForwarder]:
+    """Start ssh_conn for the duration of the block unless the caller already has it running."""
+    if ssh_conn.is_active:
+        yield ssh_conn
+        return
+    with ssh_conn:
+        yield ssh_conn
+
+
 def ssh_connect(ssh_host: str, ssh_user: str, ssh_pw: str, host: str) -> sshtunnel.SSHTunnelForwarder:
     """Open an SSH tunnel to the MySQL host.
 
     .. deprecated::
         Use :class:`MySqlConnection` instead. Pass ``ssh_host``, ``ssh_user``,
         and ``ssh_pw`` directly to the constructor; the tunnel is managed
-        automatically and torn down on :meth:`MySqlConnection.close`.
+        automatically, shared through an :class:`SSHTunnelPool` and stopped once idle.
     """
     tunnel: sshtunnel.SSHTunnelForwarder = sshtunnel.SSHTunnelForwarder(
         (ssh_host, 22),
@@ -217,7 +616,7 @@ def ssh_connect(ssh_host: str, ssh_user: str, ssh_pw: str, host: str) -> sshtunn
     return tunnel
 
 
-def mysql_connect(tunnel: sshtunnel.SSHTunnelForwarder, user: str, password: str, database: str | None = None) -> MySQLConnection:
+def mysql_connect(tunnel: sshtunnel.SSHTunnelForwarder, user: str, password: str, database: str | None = None) -> MySQLConnectionAbstract:
     """Open a MySQL connection over an existing SSH tunnel.
 
     .. deprecated::
@@ -234,7 +633,7 @@ def mysql_connect(tunnel: sshtunnel.SSHTunnelForwarder, user: str, password: str
         }
         if database:
             params['database'] = database
-        conn = MySQLConnection(**params)
+        conn = _open_mysql(params)
         logger.info("Connected to MySQL database!")
     except mysql.connector.Error as err:
         if err.errno == errorcode.ER_ACCESS_DENIED_ERROR:
@@ -247,8 +646,11 @@ def mysql_connect(tunnel: sshtunnel.SSHTunnelForwarder, user: str, password: str
     return conn
 
 
-def get_table(ssh_conn: sshtunnel.SSHTunnelForwarder, conn: MySQLConnection, table_name=None) -> pd.DataFrame:
-    """Read all rows from a MySQL table into a DataFrame.
+def get_table(ssh_conn: sshtunnel.SSHTunnelForwarder, conn: MySQLConnectionAbstract, table_name=None, columns: Sequence[str] | None = None, where: str | Mapping[str, Any] | None = None, limit: int | None = None, params: Sequence[Any] = ()) -> pd.DataFrame:
+    """Read rows from a MySQL table into a DataFrame.
+
+    columns, where and limit are applied on the server. where is either a SQL fragment using %s placeholders for values
+    supplied in params (never format values into it) or a column -> value mapping.
 
     .. deprecated::
         Use :meth:`MySqlConnection.read_table` instead. Example::
@@ -257,17 +659,15 @@ def get_table(ssh_conn: sshtunnel.SSHTunnelForwarder, conn: MySQLConnection, tab
             conn.connect()
             df = conn.read_table("my_table")
     """
-    _validate_identifier(table_name)
+    sql, params = _select_sql(table_name, columns, where, limit, params)
     logger.debug(f"Fetching table {table_name} from database...")
-    with ssh_conn:
+    with _tunnel_started(ssh_conn):
         try:
-            cursor: mysql.connector.connection.MySQLCursor = conn.cursor()
-            sql = f"SELECT * FROM {table_name};"
+            # Unbuffered so rows stream from the server page by page instead of being held twice in memory
+            cursor: mysql.connector.connection.MySQLCursor = conn.cursor(buffered=False)
             logger.debug(f"Executing SQL: {sql}")
-            cursor.execute(sql)
-            rows = cursor.fetchall()
-            column_names = [desc[0] for desc in cursor.description]
-            df = pd.DataFrame(rows, columns=column_names)
+            cursor.execute(sql, params or None)
+            df = _fetch_frame(cursor, _FETCH_ROWS)
         except mysql.connector.Error as err:
             logger.error(f"Error: {err}")
             raise
@@ -277,7 +677,7 @@ def get_table(ssh_conn: sshtunnel.SSHTunnelForwarder, conn: MySQLConnection, tab
         return df
 
 
-def write_table(ssh_conn: sshtunnel.SSHTunnelForwarder, conn: MySQLConnection, table_name: str, df: pd.DataFrame):
+def write_table(ssh_conn: sshtunnel.SSHTunnelForwarder, conn: MySQLConnectionAbstract, table_name: str, df: pd.DataFrame):
     """Write a DataFrame to a MySQL table, recreating it if it exists.
 
     .. deprecated::
@@ -289,26 +689,12 @@ def write_table(ssh_conn: sshtunnel.SSHTunnelForwarder, conn: MySQLConnection, t
     """
     _validate_identifier(table_name)
     logger.debug(f"Writing DataFrame to table {table_name} in database...")
-    with ssh_conn:
+    schema, _, name = table_name.rpartition('.')
+    with _tunnel_started(ssh_conn):
         try:
-            cursor: mysql.connector.connection.MySQLCursor = conn.cursor()
-            sql = f"DROP TABLE IF EXISTS {table_name};"
-            cursor.execute(sql)
-            sql = "SET sql_mode='ANSI_QUOTES';"
-            logger.debug(f"Executing SQL: {sql}")
-            cursor.execute(sql)
-            sql = f"CREATE TABLE {table_name}"
-            columns_with_types = ', '.join([f'"{col}" VARCHAR(255)' for col in df.columns])
-            sql += f" ({columns_with_types});"
-            logger.debug(f"Executing SQL: {sql}")
-            cursor.execute(sql)
-            conn.commit()
-            for _, row in df.iterrows():
-                placeholders = ', '.join(['%s'] * len(row))
-                columns = ', '.join(f'"{col}"' for col in row.index)
-                sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
-                cursor.execute(sql, tuple(row))
-            conn.commit()
-        except mysql.connector.Error as err:
+            # Reuse the caller's connection; StaticPool keeps SQLAlchemy from opening or closing connections of its own
+            engine = sqlalchemy.create_engine('mysql+mysqlconnector://', creator=lambda: conn, poolclass=StaticPool)
+            df.to_sql(name, engine, schema=schema or None, if_exists='replace', index=False, method='multi', chunksize=_INSERT_CHUNK_ROWS)
+        except (mysql.connector.Error, sqlalchemy.exc.SQLAlchemyError) as err:
             logger.error(f"Error: {err}")
             raise
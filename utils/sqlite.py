@@ -1,4 +1,5 @@
 import sqlite3
+from pathlib import Path
 import pandas as pd
 import re
 import logging
@@ -21,15 +22,23 @@ class SqliteConnection:
     interface of AzureSqlConnection and MySqlConnection for cross-connector compatibility.
     """
 
-    def __init__(self, file_path: str) -> None:
+    def __init__(self, file_path: str, read_only: bool = False) -> None:
         self.file_path: str = file_path
+        self.read_only: bool = read_only
         self.connection: sqlite3.Connection | None = None
 
     def connect(self) -> sqlite3.Connection:
-        logger.debug(f'Connecting to SQLite database at {self.file_path}...')
+        logger.debug(f'Connecting to SQLite database at {self.file_path} (read_only={self.read_only})...')
         if self.connection is not None:
             return self.connection
-        self.connection = sqlite3.connect(self.file_path)
+        if self.read_only:
+            # Read-only mode skips write locking; memory-map the file and enlarge the page cache for scan-heavy mining queries
+            self.connection = sqlite3.connect(f'{Path(self.file_path).resolve().as_uri()}?mode=ro', uri=True)
+            self.connection.executescript(
+                'PRAGMA query_only=1; PRAGMA mmap_size=30000000000; PRAGMA cache_size=-1048576; PRAGMA temp_store=MEMORY;'
+            )
+        else:
+            self.connection = sqlite3.connect(self.file_path)
         logger.info(f'Connected to SQLite database at {self.file_path}.')
         return self.connection
 
@@ -113,26 +122,24 @@ class SqliteConnection:
         if self.connection is None:
             raise ConnectionError('No active connection.')
         cursor = self.connection.cursor()
-        res = cursor.execute("SELECT * FROM sqlite_master WHERE type = 'table';")
+        # Let SQLite report column metadata instead of parsing the CREATE TABLE text, which breaks on types like DECIMAL(10,2)
+        res = cursor.execute("""
+            SELECT m.name, p.name, p.type, p.pk
+            FROM sqlite_master m
+            JOIN pragma_table_info(m.name) p
+            WHERE m.type = 'table'
+            ORDER BY m.rowid, p.cid;
+        """)
         results = res.fetchall()
-        names = [d[0] for d in cursor.description]
-        table_count = len(results)
-        logger.info(f'{table_count} tables found')
+        logger.info(f'{len(set(item[0] for item in results))} tables found')
         columns = []
-        for item in results:
-            row = {name: item[i] for i, name in enumerate(names)}
-            table_name = row['name']
-            field_list = row['sql'].split('(')[1].split(')')[0].split(',')
-            for field in field_list:
-                col: dict[str, str] = {}
-                meta = field.strip().split(' ')
-                col['table'] = table_name
-                col['column_name'] = meta[0]
-                if len(meta) > 1:
-                    col['datatype'] = meta[1]
-                if len(meta) > 2:
-                    col['key'] = meta[2]
-                columns.append(col)
+        for table_name, column_name, datatype, pk in results:
+            col: dict[str, str] = {'table': table_name, 'column_name': column_name}
+            if datatype:
+                col['datatype'] = datatype
+            if pk:
+                col['key'] = 'PRIMARY'
+            columns.append(col)
         logger.info(f'{len(columns)} columns found')
         return pd.DataFrame(columns)
 